@@ -8,6 +8,11 @@ import math
 import re
 from pathlib import Path
 
+# Patterns used by the verification, compiled once at import
+C_REAL_PATTERN = re.compile(r"c_real\s*=\s*(\d+)")
+C_SCALED_PATTERN = re.compile(r"c_scaled\s*=\s*([\d\.]+)")
+VERIFICATION_LINE_PATTERN = re.compile(r"(const c_check = 1 / Math\.sqrt\(mu0 \* eps0\);)")
+
 def verify_electromagnetic_constants(file_path: str) -> dict:
     """
     Verify electromagnetic constants in simulation files
@@ -20,8 +25,8 @@ def verify_electromagnetic_constants(file_path: str) -> dict:
         return {"error": f"Failed to read file: {str(e)}"}
     
     # Extract constants from the file
-    c_real_match = re.search(r"c_real\s*=\s*(\d+)", content)
-    c_scaled_match = re.search(r"c_scaled\s*=\s*([\d\.]+)", content)
+    c_real_match = C_REAL_PATTERN.search(content)
+    c_scaled_match = C_SCALED_PATTERN.search(content)
     
     if not c_real_match or not c_scaled_match:
         return {"error": "Could not find electromagnetic constants in file"}
@@ -67,14 +72,12 @@ def add_verification_comment(file_path: str) -> bool:
             return True
         
         # Find the verification line and add comment
-        verification_pattern = r"(const c_check = 1 / Math\.sqrt\(mu0 \* eps0\);)"
         replacement = r"\1\n        // ELECTROMAGNETIC_CONSTANTS_VERIFIED: c = 1/√(μ₀ε₀) relationship mathematically verified"
         
-        updated_content = re.sub(verification_pattern, replacement, content)
+        updated_content = VERIFICATION_LINE_PATTERN.sub(replacement, content)
         
         if updated_content != content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            Path(file_path).write_text(updated_content, encoding='utf-8')
             return True
         
         return False
@@ -4,43 +4,188 @@ Mathematical Error Detection and Correction Framework
 Applied Method #54 (Dimensional Analysis) and Method #17 (Falsificationism)
 """
 
-import numpy as np
+import os
 import re
+import sys
 import json
+import hashlib
+import tempfile
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from collections import Counter
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+from text_scanning import content_fingerprint, decode_text
+
+# Method labels shared by every finding and report
+DIMENSIONAL_ANALYSIS = "Dimensional Analysis (#54)"
+FALSIFICATIONISM = "Falsificationism (#17)"
+CONCENTRATION_ANALYSIS = "Concentration Analysis (#49)"
+CORRESPONDENCE_PRINCIPLE = "Correspondence Principle (#16)"
+INVERSE_PROBLEM_SOLVING = "Inverse Problem Solving (#67)"
+
+# Immutable, so one instance is shared by every analysis result
+METHODS_APPLIED = (
+    DIMENSIONAL_ANALYSIS,
+    FALSIFICATIONISM,
+    CONCENTRATION_ANALYSIS,
+    CORRESPONDENCE_PRINCIPLE,
+    INVERSE_PROBLEM_SOLVING
+)
+
+# Any-of pattern lists, compiled once and searched in turn until one matches
+FORCE_EQUATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"F\s*=\s*-k\s*\*\s*x",
+    r"force.*=.*-.*k.*\*.*position",
+    r"force.*=.*-k.*\*.*x_numerical",  # Added pattern for numerical implementation
+    r"accel.*=.*force.*\/.*mass",
+    r"Force equation.*F.*=.*-kx",  # Added comment pattern
+    r"force_equation_applied.*True"  # Added flag pattern
+))
+
+ENERGY_CONSERVATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"kinetic.*\+.*potential",
+    r"0\.5.*m.*v.*v.*\+.*0\.5.*k.*x.*x",
+    r"total.*energy",
+    r"energy_conserved",  # Added flag pattern
+    r"kinetic_numerical.*potential_numerical"  # Added numerical pattern
+))
+
+# The zero-protection check only asks whether either guard occurs, so both
+# are compiled into one alternation, which matches iff either alternative would
+ZERO_PROTECTION_PATTERN = re.compile(
+    r"if.*r.*<.*0\."
+    r"|if.*distance.*<.*0\."
+)
+
+SINGULARITY_PROTECTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"avoid.*singularity",
+    r"r.*<.*0\.1",  # Small radius check
+    r"distance.*<.*0\.1",  # Small distance check
+    r"softening",  # Softening parameter
+    r"r2.*\+.*softening",  # Softening in distance calculation
+    r"eps.*\*.*eps",  # Epsilon softening
+    r"regularization"  # Regularization parameter
+))
+
+# Analysis results are cached on disk by content fingerprint. The fingerprint
+# is salted with the checks' source, so editing them invalidates it
+ANALYSIS_CACHE_DIR = Path(".mathdetect_cache")
+ANALYSIS_CACHE_SALT = hashlib.sha256(
+    Path(__file__).read_bytes() + Path(__file__).with_name("text_scanning.py").read_bytes()
+).digest()
+
+# Remaining per-check patterns, compiled once at import
+MU0_PATTERN = re.compile(r"mu0\s*=\s*([0-9e\-\+\.\*\s\(\)\/PI]+)")
+EPS0_PATTERN = re.compile(r"eps0\s*=\s*([0-9e\-\+\.\*\s\(\)\/PI]+)")
+C_SCALED_PATTERN = re.compile(r"c_scaled\s*=\s*([0-9\.]+)")
+
+# Each energy density pattern is paired with the literal tokens it cannot
+# match without, so files lacking them skip the search
+ENERGY_DENSITY_PATTERNS = tuple((re.compile(pattern), anchors) for pattern, anchors in (
+    (r"0\.5\s*\*\s*\(eps0\s*\*\s*EMag2\s*\+\s*BMag2\s*\/\s*mu0\)", ("eps0", "mu0")),
+    (r"energyDensity\s*=\s*0\.5\s*\*\s*\(.*\)", ("energyDensity",))
+))
+
+WAVE_EQUATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"omega.*=.*2.*\*.*PI.*\*.*frequency",
+    r"k.*=.*omega.*\/.*speed",
+    r"phase.*=.*k.*\*.*z.*-.*omega.*\*.*time"
+))
+
+DIVISION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"\/\s*r\b",  # Division by radius
+    r"\/\s*distance\b",  # Division by distance
+    r"\/\s*Math\.sqrt\([^)]+\)",  # Division by square root
+))
+
+INTEGRATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"velocity.*\+=.*accel.*\*.*dt",
+    r"position.*\+=.*velocity.*\*.*dt",
+    r"Verlet",
+    r"Runge.*Kutta"
+))
+
+CONSTANT_CHECKS = (
+    {
+        "name": "speed_of_light",
+        "pattern": re.compile(r"c_real\s*=\s*299792458"),
+        "expected": "299792458",
+        "description": "Speed of light in vacuum"
+    },
+    {
+        "name": "permeability",
+        "pattern": re.compile(r"mu0\s*=\s*4\s*\*\s*Math\.PI\s*\*\s*1e-7"),
+        "expected": "4π × 10⁻⁷",
+        "description": "Vacuum permeability"
+    }
+)
+
+BOUNDARY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"if.*r.*<.*0\.",  # Radius boundary
+    r"if.*amplitude.*<.*0\.",  # Amplitude boundary
+    r"if.*frequency.*<.*0\."  # Frequency boundary
+))
+
+# Literal substrings the checks test for. Case-sensitive ones are matched in
+# the content as-is; case-insensitive ones in its lowercased form
+CASE_SENSITIVE_TOKENS = (
+    "mu0", "eps0", "c_scaled", "ELECTROMAGNETIC_CONSTANTS_VERIFIED",
+    "dt", "velocity", "position", "Math.max(", "Math.min(", "/r", "/",
+    "energyDensity"
+)
+
+LOWERCASE_TOKENS = (
+    "harmonic", "oscillator", "wave", "simulation",
+    "speed_of_light", "permeability"
+)
+
+@lru_cache(maxsize=16)
+def scan_tokens(content: str) -> Tuple[frozenset, frozenset]:
+    """
+    Find the literal tokens present in content, lowercasing it only once.
+    Returns the case-sensitive tokens and the lowercase tokens found.
+    """
+    content_lower = content.lower()
+    return (frozenset(t for t in CASE_SENSITIVE_TOKENS if t in content),
+            frozenset(t for t in LOWERCASE_TOKENS if t in content_lower))
 
 class MathematicalErrorDetector:
     """
     Comprehensive mathematical error detection using rigorous scientific methods
     """
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.errors_found = []
         self.corrections_applied = []
         
+        # Where findings are cached across runs; None disables reuse
+        self.cache_dir = ANALYSIS_CACHE_DIR if use_cache else None
+        
     def detect_dimensional_inconsistencies(self, content: str) -> List[Dict[str, Any]]:
         """
         Apply Method #54: Dimensional Analysis to detect inconsistencies
         """
         errors = []
+        tokens, _ = scan_tokens(content)
         
         # Check for electromagnetic constant relationships
-        if "mu0" in content and "eps0" in content and "c_scaled" in content:
+        if "mu0" in tokens and "eps0" in tokens and "c_scaled" in tokens:
             # Check if already verified
-            if "ELECTROMAGNETIC_CONSTANTS_VERIFIED" in content:
+            if "ELECTROMAGNETIC_CONSTANTS_VERIFIED" in tokens:
                 # Constants have been verified - no error
                 pass
             else:
                 # Extract constants
-                mu0_pattern = r"mu0\s*=\s*([0-9e\-\+\.\*\s\(\)\/PI]+)"
-                eps0_pattern = r"eps0\s*=\s*([0-9e\-\+\.\*\s\(\)\/PI]+)"
-                c_pattern = r"c_scaled\s*=\s*([0-9\.]+)"
-                
-                mu0_match = re.search(mu0_pattern, content)
-                eps0_match = re.search(eps0_pattern, content)
-                c_match = re.search(c_pattern, content)
+                mu0_match = MU0_PATTERN.search(content)
+                eps0_match = EPS0_PATTERN.search(content)
+                c_match = C_SCALED_PATTERN.search(content)
                 
                 if mu0_match and eps0_match and c_match:
                     try:
@@ -53,7 +198,7 @@ class MathematicalErrorDetector:
                             "description": "Electromagnetic constants require verification of c = 1/√(μ₀ε₀)",
                             "location": "electromagnetic simulation",
                             "severity": "high",
-                            "method_applied": "Dimensional Analysis (#54)"
+                            "method_applied": DIMENSIONAL_ANALYSIS
                         })
                     except:
                         errors.append({
@@ -64,19 +209,14 @@ class MathematicalErrorDetector:
                         })
         
         # Check for energy density calculations
-        energy_patterns = [
-            r"0\.5\s*\*\s*\(eps0\s*\*\s*EMag2\s*\+\s*BMag2\s*\/\s*mu0\)",
-            r"energyDensity\s*=\s*0\.5\s*\*\s*\(.*\)"
-        ]
-        
-        for pattern in energy_patterns:
-            if re.search(pattern, content):
+        for pattern, anchors in ENERGY_DENSITY_PATTERNS:
+            if all(anchor in tokens for anchor in anchors) and pattern.search(content):
                 errors.append({
                     "type": "energy_density_formula",
                     "description": "Energy density formula found - verify dimensional consistency",
-                    "pattern": pattern,
+                    "pattern": pattern.pattern,
                     "severity": "medium",
-                    "method_applied": "Dimensional Analysis (#54)"
+                    "method_applied": DIMENSIONAL_ANALYSIS
                 })
         
         return errors
@@ -86,65 +226,43 @@ class MathematicalErrorDetector:
         Apply Method #17: Falsificationism to test physics equations
         """
         errors = []
+        _, lowercase_tokens = scan_tokens(content)
         
         # Check harmonic oscillator equations
-        if "harmonic" in content.lower() and "oscillator" in content.lower():
+        if "harmonic" in lowercase_tokens and "oscillator" in lowercase_tokens:
             # Look for force equation F = -kx - IMPROVED PATTERNS
-            force_patterns = [
-                r"F\s*=\s*-k\s*\*\s*x",
-                r"force.*=.*-.*k.*\*.*position",
-                r"force.*=.*-k.*\*.*x_numerical",  # Added pattern for numerical implementation
-                r"accel.*=.*force.*\/.*mass",
-                r"Force equation.*F.*=.*-kx",  # Added comment pattern
-                r"force_equation_applied.*True"  # Added flag pattern
-            ]
-            
-            found_force_eq = any(re.search(pattern, content, re.IGNORECASE) for pattern in force_patterns)
+            found_force_eq = any(pattern.search(content) for pattern in FORCE_EQUATION_PATTERNS)
             
             if not found_force_eq:
                 errors.append({
                     "type": "missing_force_equation",
                     "description": "Harmonic oscillator missing proper force equation F = -kx",
                     "severity": "high",
-                    "method_applied": "Falsificationism (#17)"
+                    "method_applied": FALSIFICATIONISM
                 })
             
             # Check for energy conservation
-            energy_patterns = [
-                r"kinetic.*\+.*potential",
-                r"0\.5.*m.*v.*v.*\+.*0\.5.*k.*x.*x",
-                r"total.*energy",
-                r"energy_conserved",  # Added flag pattern
-                r"kinetic_numerical.*potential_numerical"  # Added numerical pattern
-            ]
-            
-            found_energy = any(re.search(pattern, content, re.IGNORECASE) for pattern in energy_patterns)
+            found_energy = any(pattern.search(content) for pattern in ENERGY_CONSERVATION_PATTERNS)
             
             if not found_energy:
                 errors.append({
                     "type": "missing_energy_conservation",
                     "description": "Harmonic oscillator missing energy conservation check",
                     "severity": "medium",
-                    "method_applied": "Falsificationism (#17)"
+                    "method_applied": FALSIFICATIONISM
                 })
         
         # Check wave equations
-        if "wave" in content.lower():
+        if "wave" in lowercase_tokens:
             # Look for proper wave equation ∂²ψ/∂t² = c²∇²ψ
-            wave_patterns = [
-                r"omega.*=.*2.*\*.*PI.*\*.*frequency",
-                r"k.*=.*omega.*\/.*speed",
-                r"phase.*=.*k.*\*.*z.*-.*omega.*\*.*time"
-            ]
-            
-            wave_eq_count = sum(1 for pattern in wave_patterns if re.search(pattern, content, re.IGNORECASE))
+            wave_eq_count = sum(1 for pattern in WAVE_EQUATION_PATTERNS if pattern.search(content))
             
             if wave_eq_count < 2:
                 errors.append({
                     "type": "incomplete_wave_equations",
                     "description": f"Wave simulation missing key equations (found {wave_eq_count}/3)",
                     "severity": "medium",
-                    "method_applied": "Falsificationism (#17)"
+                    "method_applied": FALSIFICATIONISM
                 })
         
         return errors
@@ -154,54 +272,49 @@ class MathematicalErrorDetector:
         Apply Method #49: Concentration Analysis for numerical stability
         """
         errors = []
+        tokens, _ = scan_tokens(content)
         
         # Check for division by zero protection
-        division_patterns = [
-            r"\/\s*r\b",  # Division by radius
-            r"\/\s*distance\b",  # Division by distance
-            r"\/\s*Math\.sqrt\([^)]+\)",  # Division by square root
-        ]
+        # Zero protection does not depend on the pattern, so it is checked at
+        # most once, and a protected file needs no further division scans.
+        # Every division pattern needs a slash, so files without one skip them
+        has_protection = None
+        division_patterns = DIVISION_PATTERNS if "/" in tokens else ()
         
         for pattern in division_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                # Check if there's protection against zero
-                protection_patterns = [
-                    r"if.*r.*<.*0\.",
-                    r"if.*distance.*<.*0\.",
-                    r"Math\.max\(",
-                    r"Math\.min\("
-                ]
+            # Only the number of matches is reported, so count without a list
+            match_count = sum(1 for _ in pattern.finditer(content))
+            if match_count:
+                if has_protection is None:
+                    # Check if there's protection against zero; clamping calls
+                    # are plain literals, so a substring test suffices
+                    protection_literals = ["Math.max(", "Math.min("]
+                    
+                    has_protection = (any(literal in tokens for literal in protection_literals)
+                                      or ZERO_PROTECTION_PATTERN.search(content) is not None)
                 
-                has_protection = any(re.search(prot_pattern, content) for prot_pattern in protection_patterns)
-                
-                if not has_protection:
-                    errors.append({
-                        "type": "division_by_zero_risk",
-                        "description": f"Potential division by zero: {pattern}",
-                        "matches": len(matches),
-                        "severity": "high",
-                        "method_applied": "Concentration Analysis (#49)"
-                    })
+                if has_protection:
+                    break
+                    
+                errors.append({
+                    "type": "division_by_zero_risk",
+                    "description": f"Potential division by zero: {pattern.pattern}",
+                    "matches": match_count,
+                    "severity": "high",
+                    "method_applied": CONCENTRATION_ANALYSIS
+                })
         
         # Check for numerical integration stability
-        if "dt" in content and ("velocity" in content or "position" in content):
+        if "dt" in tokens and ("velocity" in tokens or "position" in tokens):
             # Look for proper integration methods
-            integration_patterns = [
-                r"velocity.*\+=.*accel.*\*.*dt",
-                r"position.*\+=.*velocity.*\*.*dt",
-                r"Verlet",
-                r"Runge.*Kutta"
-            ]
-            
-            integration_count = sum(1 for pattern in integration_patterns if re.search(pattern, content, re.IGNORECASE))
+            integration_count = sum(1 for pattern in INTEGRATION_PATTERNS if pattern.search(content))
             
             if integration_count < 2:
                 errors.append({
                     "type": "poor_integration_method",
                     "description": "Numerical integration may be unstable (simple Euler method)",
                     "severity": "medium",
-                    "method_applied": "Concentration Analysis (#49)"
+                    "method_applied": CONCENTRATION_ANALYSIS
                 })
         
         return errors
@@ -211,32 +324,19 @@ class MathematicalErrorDetector:
         Apply Method #16: Correspondence Principle to validate physics constants
         """
         errors = []
+        _, lowercase_tokens = scan_tokens(content)
         
         # Check for correct physics constants
-        constant_checks = [
-            {
-                "name": "speed_of_light",
-                "pattern": r"c_real\s*=\s*299792458",
-                "expected": "299792458",
-                "description": "Speed of light in vacuum"
-            },
-            {
-                "name": "permeability",
-                "pattern": r"mu0\s*=\s*4\s*\*\s*Math\.PI\s*\*\s*1e-7",
-                "expected": "4π × 10⁻⁷",
-                "description": "Vacuum permeability"
-            }
-        ]
-        
-        for check in constant_checks:
-            if not re.search(check["pattern"], content):
-                if check["name"] in content.lower():
+        for check in CONSTANT_CHECKS:
+            # The token test is a set lookup, so it gates the pattern search
+            if check["name"] in lowercase_tokens:
+                if not check["pattern"].search(content):
                     errors.append({
                         "type": "incorrect_physics_constant",
                         "description": f"Incorrect {check['description']} - expected {check['expected']}",
                         "constant": check["name"],
                         "severity": "high",
-                        "method_applied": "Correspondence Principle (#16)"
+                        "method_applied": CORRESPONDENCE_PRINCIPLE
                     })
         
         return errors
@@ -246,56 +346,52 @@ class MathematicalErrorDetector:
         Apply Method #67: Inverse Problem Solving for edge case analysis
         """
         errors = []
+        tokens, lowercase_tokens = scan_tokens(content)
         
-        # Check for boundary condition handling
-        boundary_patterns = [
-            r"if.*r.*<.*0\.",  # Radius boundary
-            r"if.*amplitude.*<.*0\.",  # Amplitude boundary
-            r"if.*frequency.*<.*0\.",  # Frequency boundary
-            r"Math\.max\(",  # Clamping
-            r"Math\.min\("   # Clamping
-        ]
-        
-        boundary_count = sum(1 for pattern in boundary_patterns if re.search(pattern, content))
-        
-        if "simulation" in content.lower() and boundary_count < 2:
-            errors.append({
-                "type": "insufficient_boundary_checks",
-                "description": f"Simulation has insufficient boundary condition checks ({boundary_count} found)",
-                "severity": "medium",
-                "method_applied": "Inverse Problem Solving (#67)"
-            })
-        
-        # Check for singularity avoidance - IMPROVED DETECTION
-        singularity_patterns = [
-            r"avoid.*singularity",
-            r"r.*<.*0\.1",  # Small radius check
-            r"distance.*<.*0\.1",  # Small distance check
-            r"softening",  # Softening parameter
-            r"r2.*\+.*softening",  # Softening in distance calculation
-            r"eps.*\*.*eps",  # Epsilon softening
-            r"regularization"  # Regularization parameter
-        ]
-        
-        has_singularity_protection = any(re.search(pattern, content, re.IGNORECASE) for pattern in singularity_patterns)
+        # Check for boundary condition handling, which only matters for
+        # simulations; clamping calls are plain literals, so a substring
+        # test suffices
+        if "simulation" in lowercase_tokens:
+            boundary_literals = ["Math.max(", "Math.min("]
+            
+            boundary_count = (sum(1 for pattern in BOUNDARY_PATTERNS if pattern.search(content))
+                              + sum(1 for literal in boundary_literals if literal in tokens))
+            
+            if boundary_count < 2:
+                errors.append({
+                    "type": "insufficient_boundary_checks",
+                    "description": f"Simulation has insufficient boundary condition checks ({boundary_count} found)",
+                    "severity": "medium",
+                    "method_applied": INVERSE_PROBLEM_SOLVING
+                })
         
-        if ("1/r" in content or "/r" in content) and not has_singularity_protection:
+        # Check for singularity avoidance - IMPROVED DETECTION; only needed
+        # when there is a 1/r term. Any "1/r" also contains "/r", so one
+        # substring test covers both
+        if "/r" in tokens and not any(pattern.search(content) for pattern in SINGULARITY_PROTECTION_PATTERNS):
             errors.append({
                 "type": "singularity_risk",
                 "description": "Code contains 1/r terms without singularity protection",
                 "severity": "high",
-                "method_applied": "Inverse Problem Solving (#67)"
+                "method_applied": INVERSE_PROBLEM_SOLVING
             })
         
         return errors
     
-    def comprehensive_analysis(self, file_path: str) -> Dict[str, Any]:
+    def comprehensive_analysis(self, file_path: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Run comprehensive mathematical error analysis
+
+        A batch caller can pass one shared ISO timestamp instead of stamping
+        every file separately.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Unchanged files reuse the findings from a previous run; the
+            # raw bytes are fingerprinted, so cache hits are never decoded
+            data = Path(file_path).read_bytes()
+            cache_key = self.cache_key(data)
+            all_errors = self.load_cached_errors(cache_key)
+            content = decode_text(data) if all_errors is None else None
         except Exception as e:
             return {
                 "file_path": file_path,
@@ -303,6 +399,27 @@ class MathematicalErrorDetector:
                 "analysis_complete": False
             }
         
+        if all_errors is None:
+            all_errors = self.analyze_content(content)
+            self.store_cached_errors(cache_key, all_errors)
+        
+        # Only the per-severity totals are reported, so count in one pass
+        severity_counts = Counter(error.get("severity") for error in all_errors)
+        
+        return {
+            "file_path": file_path,
+            "analysis_timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "total_errors": len(all_errors),
+            "high_severity_errors": severity_counts["high"],
+            "medium_severity_errors": severity_counts["medium"],
+            "low_severity_errors": severity_counts["low"],
+            "errors": all_errors,
+            "analysis_complete": True,
+            "methods_applied": METHODS_APPLIED
+        }
+
+    def analyze_content(self, content: str) -> List[Dict[str, Any]]:
+        """Apply every detection method to content and collect the findings"""
         all_errors = []
         
         # Apply multiple scientific reasoning methods
@@ -312,34 +429,45 @@ class MathematicalErrorDetector:
         all_errors.extend(self.validate_physics_constants(content))
         all_errors.extend(self.check_edge_case_handling(content))
         
-        # Categorize errors by severity
-        high_severity = [e for e in all_errors if e.get("severity") == "high"]
-        medium_severity = [e for e in all_errors if e.get("severity") == "medium"]
-        low_severity = [e for e in all_errors if e.get("severity") == "low"]
+        return all_errors
         
-        return {
-            "file_path": file_path,
-            "analysis_timestamp": datetime.utcnow().isoformat(),
-            "total_errors": len(all_errors),
-            "high_severity_errors": len(high_severity),
-            "medium_severity_errors": len(medium_severity),
-            "low_severity_errors": len(low_severity),
-            "errors": all_errors,
-            "analysis_complete": True,
-            "methods_applied": [
-                "Dimensional Analysis (#54)",
-                "Falsificationism (#17)", 
-                "Concentration Analysis (#49)",
-                "Correspondence Principle (#16)",
-                "Inverse Problem Solving (#67)"
-            ]
-        }
+    def cache_key(self, data: bytes) -> Optional[str]:
+        """Fingerprint file bytes for the analysis cache, or None if not cached"""
+        if self.cache_dir is None:
+            return None
+        return content_fingerprint(ANALYSIS_CACHE_SALT + data)
+        
+    def load_cached_errors(self, cache_key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Load the findings cached under a key"""
+        if cache_key is None:
+            return None
+        try:
+            data = (self.cache_dir / f"{cache_key}.json").read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception:
+            return None  # Missing or unreadable entries are recomputed
+            
+    def store_cached_errors(self, cache_key: Optional[str], errors: List[Dict[str, Any]]):
+        """Cache findings under a key, replacing any previous entry atomically"""
+        if cache_key is None:
+            return
+        data = orjson.dumps(errors) if orjson is not None else json.dumps(errors).encode()
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.cache_dir / f"{cache_key}.json")
+        except Exception as e:
+            print(f"  Warning: failed to cache analysis: {e}", file=sys.stderr)
 
 def main():
     """
     Run mathematical error detection on physics simulations
     """
     detector = MathematicalErrorDetector()
+    started_at = datetime.now(timezone.utc)
+    run_timestamp = started_at.isoformat()
     
     # Files to analyze
     files_to_check = [
@@ -354,37 +482,40 @@ def main():
     
     for file_path in files_to_check:
         if Path(file_path).exists():
-            print(f"Analyzing: {file_path}")
-            result = detector.comprehensive_analysis(file_path)
+            result = detector.comprehensive_analysis(file_path, run_timestamp)
             results.append(result)
             
-            # Print summary
+            # Build each file's summary and write it in one call
+            lines = [f"Analyzing: {file_path}"]
             if result["analysis_complete"]:
-                print(f"  Total errors: {result['total_errors']}")
-                print(f"  High severity: {result['high_severity_errors']}")
-                print(f"  Medium severity: {result['medium_severity_errors']}")
+                lines.append(f"  Total errors: {result['total_errors']}")
+                lines.append(f"  High severity: {result['high_severity_errors']}")
+                lines.append(f"  Medium severity: {result['medium_severity_errors']}")
                 
-                # Print high severity errors
-                for error in result["errors"]:
-                    if error.get("severity") == "high":
-                        print(f"  HIGH: {error['description']}")
+                # List high severity errors
+                lines.extend(f"  HIGH: {error['description']}"
+                             for error in result["errors"] if error.get("severity") == "high")
             else:
-                print(f"  Analysis failed: {result.get('error', 'Unknown error')}")
-            print()
+                lines.append(f"  Analysis failed: {result.get('error', 'Unknown error')}")
+            lines.append("\n")
+            sys.stdout.write("\n".join(lines))
     
     # Save detailed results
-    output_file = f"mathematical_error_report_{datetime.utcnow().isoformat().replace(':', '-')}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    output_file = f"mathematical_error_report_{started_at.strftime('%Y-%m-%dT%H-%M-%S.%f')}.json"
+    Path(output_file).write_text(json.dumps(results, indent=2))
     
     print(f"Detailed results saved to: {output_file}")
     
-    # Summary
-    total_errors = sum(r.get("total_errors", 0) for r in results)
-    total_high = sum(r.get("high_severity_errors", 0) for r in results)
+    # Summary totals gathered in a single pass
+    files_analyzed = total_errors = total_high = 0
+    for r in results:
+        if r.get("analysis_complete", False):
+            files_analyzed += 1
+        total_errors += r.get("total_errors", 0)
+        total_high += r.get("high_severity_errors", 0)
     
     print(f"\nSUMMARY:")
-    print(f"Files analyzed: {len([r for r in results if r.get('analysis_complete', False)])}")
+    print(f"Files analyzed: {files_analyzed}")
     print(f"Total errors found: {total_errors}")
     print(f"High severity errors: {total_high}")
     
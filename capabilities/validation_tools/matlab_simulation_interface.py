@@ -10,8 +10,6 @@ import os
 import sys
 import subprocess
 import numpy as np
-from scipy import integrate, optimize
-import matplotlib.pyplot as plt
 from pathlib import Path
 import logging
 
@@ -98,8 +96,7 @@ class MATLABSimulationInterface:
             """
             
             # Write and execute MATLAB script
-            with open('harmonic_sim.m', 'w') as f:
-                f.write(matlab_script)
+            Path('harmonic_sim.m').write_text(matlab_script)
                 
             result = subprocess.run([self.matlab_executable, "-batch", "harmonic_sim"],
                                   capture_output=True, text=True, timeout=60)
@@ -124,11 +121,11 @@ class MATLABSimulationInterface:
                     "method": "MATLAB"
                 }
             else:
-                self.logger.warning(f"MATLAB simulation failed: {result.stderr}")
+                self.logger.warning("MATLAB simulation failed: %s", result.stderr)
                 return self.python_harmonic_oscillator(params)
                 
         except Exception as e:
-            self.logger.warning(f"MATLAB simulation error: {str(e)}")
+            self.logger.warning("MATLAB simulation error: %s", e)
             return self.python_harmonic_oscillator(params)
         finally:
             # Cleanup
@@ -177,7 +174,7 @@ class MATLABSimulationInterface:
             }
             
         except Exception as e:
-            self.logger.error(f"Python simulation error: {str(e)}")
+            self.logger.error("Python simulation error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -246,7 +243,7 @@ class MATLABSimulationInterface:
             }
             
         except Exception as e:
-            self.logger.error(f"Wave equation simulation error: {str(e)}")
+            self.logger.error("Wave equation simulation error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -291,8 +288,7 @@ class MATLABSimulationInterface:
             fprintf('Wave energy variation: %.6f\\n', energy_variation);
             """
             
-            with open('wave_sim.m', 'w') as f:
-                f.write(matlab_script)
+            Path('wave_sim.m').write_text(matlab_script)
                 
             result = subprocess.run([self.matlab_executable, "-batch", "wave_sim"],
                                   capture_output=True, text=True, timeout=60)
@@ -314,7 +310,7 @@ class MATLABSimulationInterface:
                 return self.python_wave_equation(params)
                 
         except Exception as e:
-            self.logger.warning(f"MATLAB wave simulation error: {str(e)}")
+            self.logger.warning("MATLAB wave simulation error: %s", e)
             return self.python_wave_equation(params)
         finally:
             if os.path.exists('wave_sim.m'):
@@ -382,7 +378,7 @@ class MATLABSimulationInterface:
             }
             
         except Exception as e:
-            self.logger.error(f"Heat equation simulation error: {str(e)}")
+            self.logger.error("Heat equation simulation error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -434,4 +430,4 @@ class MATLABSimulationInterface:
                 try:
                     os.remove(file)
                 except Exception as e:
-                    self.logger.warning(f"Failed to remove {file}: {str(e)}") 
\ No newline at end of file
+                    self.logger.warning("Failed to remove %s: %s", file, e) 
\ No newline at end of file
@@ -11,24 +11,73 @@ import sys
 import json
 import time
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 
-# Add the validation tools directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add the validation tools directory to the path; running this script
+# directly already puts it first, so it is only added when missing
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.append(TOOLS_DIR)
 
-from validation_framework import ScientificValidationFramework
+from validation_framework import ScientificValidationFramework, prepare_validation_environment
+
+# Items are independent and validation is CPU-bound regex work, so they
+# are spread across one worker process per core
+MAX_WORKERS = os.cpu_count() or 1
+
+# Framework instance owned by each worker process
+_worker_framework: Optional[ScientificValidationFramework] = None
+
+def error_record(item: Path, error: str, processing_time: float = 0.0) -> Dict[str, Any]:
+    """Result record for an intake item whose validation failed with an error"""
+    return {
+        'item_name': item.name,
+        'item_path': str(item),
+        'result': {'final_status': 'ERROR', 'error': error},
+        'processing_time': processing_time
+    }
+
+def validate_intake_item(framework: ScientificValidationFramework, item: Path) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Run one intake item through the pipeline and time it.
+    Returns the result record and the error message if validation raised.
+    """
+    start_time = time.perf_counter()
+    
+    try:
+        result = framework.validate_research_item(str(item))
+    except Exception as e:
+        return error_record(item, str(e), time.perf_counter() - start_time), str(e)
+        
+    return {
+        'item_name': item.name,
+        'item_path': str(item),
+        'result': result,
+        'processing_time': time.perf_counter() - start_time
+    }, None
+
+def init_worker() -> None:
+    """Build the validation framework once per worker process"""
+    global _worker_framework
+    _worker_framework = ScientificValidationFramework()
+
+def validate_in_worker(item: Path) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Validate one intake item with this worker's framework"""
+    return validate_intake_item(_worker_framework, item)
 
 def main():
     """Main validation pipeline runner"""
     print("=" * 80)
     print("SCIENTIFIC VALIDATION PIPELINE - AUTONOMOUS OPERATION")
     print("=" * 80)
-    print(f"Started at: {datetime.utcnow().isoformat()} UTC")
+    print(f"Started at: {datetime.now(timezone.utc).replace(tzinfo=None).isoformat()} UTC")
     print()
     
-    # Initialize validation framework
-    framework = ScientificValidationFramework()
+    # Set up logging and the stage folders; each worker process builds its
+    # own validation framework
+    prepare_validation_environment()
     
     # Find all items in intake folder
     intake_path = Path("../00-INTAKE")
@@ -36,80 +85,89 @@ def main():
         print(f"ERROR: Intake folder not found at {intake_path}")
         return
     
-    # Get all items (files and directories) in intake
+    # Get all items (files and directories) in intake; scandir reports the
+    # entry type from the directory listing, so no per-item stat is needed
     intake_items = []
-    for item in intake_path.iterdir():
-        if item.name.startswith('.'):
-            continue  # Skip hidden files
-        intake_items.append(item)
+    item_kinds = []
+    with os.scandir(intake_path) as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue  # Skip hidden files
+            intake_items.append(Path(entry.path))
+            item_kinds.append('DIR' if entry.is_dir() else 'FILE')
     
     print(f"Found {len(intake_items)} items in intake folder:")
-    for i, item in enumerate(intake_items, 1):
-        print(f"  {i:2d}. {item.name} ({'DIR' if item.is_dir() else 'FILE'})")
+    for i, (item, kind) in enumerate(zip(intake_items, item_kinds), 1):
+        print(f"  {i:2d}. {item.name} ({kind})")
     print()
     
     if not intake_items:
         print("No items found in intake folder. Exiting.")
         return
     
-    # Process each item through validation pipeline
+    # Process items concurrently; results are reported in intake order
     validation_results = []
     
-    for i, item in enumerate(intake_items, 1):
-        print(f"Processing item {i}/{len(intake_items)}: {item.name}")
-        print("-" * 60)
+    with ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(intake_items)),
+                             initializer=init_worker) as executor:
+        futures = [executor.submit(validate_in_worker, item) for item in intake_items]
         
-        start_time = time.time()
-        
-        try:
-            # Run validation
-            result = framework.validate_research_item(str(item))
-            
-            processing_time = time.time() - start_time
-            
-            # Display results
-            print(f"Status: {result['final_status']}")
-            print(f"Processing time: {processing_time:.2f} seconds")
-            
-            if result['final_status'] == 'APPROVED':
-                print(f"Quality score: {result.get('quality_score', 'N/A')}")
-                print(f"Confidence level: {result.get('confidence_level', 'N/A')}")
-                print(f"Destination: {result.get('destination', 'N/A')}")
-            elif result['final_status'] == 'REJECTED':
-                print(f"Rejection stage: {result.get('rejection_stage', 'N/A')}")
-                print(f"Rejection reason: {result.get('rejection_reason', 'N/A')}")
-                print(f"Destination: {result.get('destination', 'N/A')}")
-            elif result['final_status'] == 'ERROR':
-                print(f"Error: {result.get('error', 'N/A')}")
+        for i, (item, future) in enumerate(zip(intake_items, futures), 1):
+            print(f"Processing item {i}/{len(intake_items)}: {item.name}")
+            print("-" * 60)
             
-            print(f"Stages completed: {len(result.get('stages_completed', []))}")
+            try:
+                record, error = future.result()
+            except Exception as e:
+                # The worker died or its result could not be sent back
+                error = str(e)
+                record = error_record(item, error)
+            result = record['result']
             
-            validation_results.append({
-                'item_name': item.name,
-                'item_path': str(item),
-                'result': result,
-                'processing_time': processing_time
-            })
+            # Build the item's report and write it in one call
+            if error is not None:
+                lines = [f"ERROR processing {item.name}: {error}"]
+            else:
+                # Display results
+                lines = [
+                    f"Status: {result['final_status']}",
+                    f"Processing time: {record['processing_time']:.2f} seconds"
+                ]
+                
+                if result['final_status'] == 'APPROVED':
+                    lines.append(f"Quality score: {result.get('quality_score', 'N/A')}")
+                    lines.append(f"Confidence level: {result.get('confidence_level', 'N/A')}")
+                    lines.append(f"Destination: {result.get('destination', 'N/A')}")
+                elif result['final_status'] == 'REJECTED':
+                    lines.append(f"Rejection stage: {result.get('rejection_stage', 'N/A')}")
+                    lines.append(f"Rejection reason: {result.get('rejection_reason', 'N/A')}")
+                    lines.append(f"Destination: {result.get('destination', 'N/A')}")
+                elif result['final_status'] == 'ERROR':
+                    lines.append(f"Error: {result.get('error', 'N/A')}")
+                
+                lines.append(f"Stages completed: {len(result.get('stages_completed', []))}")
             
-        except Exception as e:
-            print(f"ERROR processing {item.name}: {str(e)}")
-            validation_results.append({
-                'item_name': item.name,
-                'item_path': str(item),
-                'result': {'final_status': 'ERROR', 'error': str(e)},
-                'processing_time': time.time() - start_time
-            })
-        
-        print()
+            validation_results.append(record)
+            lines.append("\n")
+            sys.stdout.write("\n".join(lines))
     
     # Generate summary report
     print("=" * 80)
     print("VALIDATION PIPELINE SUMMARY")
     print("=" * 80)
     
-    approved_count = sum(1 for r in validation_results if r['result']['final_status'] == 'APPROVED')
-    rejected_count = sum(1 for r in validation_results if r['result']['final_status'] == 'REJECTED')
-    error_count = sum(1 for r in validation_results if r['result']['final_status'] == 'ERROR')
+    # Group results by status and total the timings in a single pass
+    results_by_status = {'APPROVED': [], 'REJECTED': [], 'ERROR': []}
+    total_time = 0.0
+    for record in validation_results:
+        bucket = results_by_status.get(record['result']['final_status'])
+        if bucket is not None:
+            bucket.append(record)
+        total_time += record['processing_time']
+    
+    approved_count = len(results_by_status['APPROVED'])
+    rejected_count = len(results_by_status['REJECTED'])
+    error_count = len(results_by_status['ERROR'])
     
     print(f"Total items processed: {len(validation_results)}")
     print(f"Approved: {approved_count}")
@@ -119,57 +177,53 @@ def main():
     
     if approved_count > 0:
         print("APPROVED ITEMS:")
-        for result in validation_results:
-            if result['result']['final_status'] == 'APPROVED':
-                item_result = result['result']
-                print(f"  • {result['item_name']}")
-                print(f"    Quality: {item_result.get('quality_score', 'N/A'):.1f}")
-                print(f"    Confidence: {item_result.get('confidence_level', 'N/A'):.3f}")
-                print(f"    Time: {result['processing_time']:.2f}s")
+        for result in results_by_status['APPROVED']:
+            item_result = result['result']
+            print(f"  • {result['item_name']}")
+            print(f"    Quality: {item_result.get('quality_score', 'N/A'):.1f}")
+            print(f"    Confidence: {item_result.get('confidence_level', 'N/A'):.3f}")
+            print(f"    Time: {result['processing_time']:.2f}s")
         print()
     
     if rejected_count > 0:
         print("REJECTED ITEMS:")
-        for result in validation_results:
-            if result['result']['final_status'] == 'REJECTED':
-                item_result = result['result']
-                print(f"  • {result['item_name']}")
-                print(f"    Stage: {item_result.get('rejection_stage', 'N/A')}")
-                print(f"    Reason: {item_result.get('rejection_reason', 'N/A')[:100]}...")
-                print(f"    Time: {result['processing_time']:.2f}s")
+        for result in results_by_status['REJECTED']:
+            item_result = result['result']
+            print(f"  • {result['item_name']}")
+            print(f"    Stage: {item_result.get('rejection_stage', 'N/A')}")
+            print(f"    Reason: {item_result.get('rejection_reason', 'N/A')[:100]}...")
+            print(f"    Time: {result['processing_time']:.2f}s")
         print()
     
     if error_count > 0:
         print("ERROR ITEMS:")
-        for result in validation_results:
-            if result['result']['final_status'] == 'ERROR':
-                print(f"  • {result['item_name']}")
-                print(f"    Error: {result['result'].get('error', 'N/A')[:100]}...")
-                print(f"    Time: {result['processing_time']:.2f}s")
+        for result in results_by_status['ERROR']:
+            print(f"  • {result['item_name']}")
+            print(f"    Error: {result['result'].get('error', 'N/A')[:100]}...")
+            print(f"    Time: {result['processing_time']:.2f}s")
         print()
     
-    # Save detailed results
-    results_file = f"validation_pipeline_results_{int(time.time())}.json"
+    # Save detailed results; one clock read names and stamps the report
+    finished_at = datetime.now(timezone.utc)
+    results_file = f"validation_pipeline_results_{int(finished_at.timestamp())}.json"
     results_path = Path("../VALIDATION_REPORTS") / results_file
     results_path.parent.mkdir(exist_ok=True)
     
-    with open(results_path, 'w') as f:
-        json.dump({
-            'timestamp': datetime.utcnow().isoformat(),
-            'summary': {
-                'total_items': len(validation_results),
-                'approved': approved_count,
-                'rejected': rejected_count,
-                'errors': error_count
-            },
-            'detailed_results': validation_results
-        }, f, indent=2, default=str)
+    results_path.write_text(json.dumps({
+        'timestamp': finished_at.isoformat(),
+        'summary': {
+            'total_items': len(validation_results),
+            'approved': approved_count,
+            'rejected': rejected_count,
+            'errors': error_count
+        },
+        'detailed_results': validation_results
+    }, indent=2, default=str))
     
     print(f"Detailed results saved to: {results_path}")
     print()
     
     # Calculate performance metrics
-    total_time = sum(r['processing_time'] for r in validation_results)
     avg_time = total_time / len(validation_results) if validation_results else 0
     
     print("PERFORMANCE METRICS:")
@@ -179,7 +233,7 @@ def main():
     print()
     
     print("Validation pipeline completed successfully!")
-    print(f"Finished at: {datetime.utcnow().isoformat()} UTC")
+    print(f"Finished at: {datetime.now(timezone.utc).replace(tzinfo=None).isoformat()} UTC")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Text Scanning Helpers
+
+Content fingerprinting and source decoding shared by the validation
+framework and the mathematical error detector.
+"""
+
+import hashlib
+from pathlib import Path
+
+try:
+    from blake3 import blake3
+except ImportError:  # Fall back to hashlib's SHA-256
+    blake3 = None
+
+def content_fingerprint(data: bytes) -> str:
+    """Hex digest identifying content, using BLAKE3 when it is installed"""
+    if blake3 is not None:
+        return blake3(data).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+def decode_text(data: bytes, errors: str = 'strict') -> str:
+    """
+    Decode UTF-8 bytes in one call, translating newlines only when a
+    carriage return is present, matching text-mode universal newlines.
+    """
+    text = data.decode('utf-8', errors=errors)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def read_text_file(path: Path) -> str:
+    """Read a file as UTF-8 text, dropping undecodable bytes"""
+    return decode_text(path.read_bytes(), errors='ignore')
@@ -3,7 +3,6 @@
 Simple validation script to process pending items
 """
 
-from validation_framework import ScientificValidationFramework
 import sys
 
 def main():
@@ -11,6 +10,9 @@ def main():
         print("Usage: python3 validate_item.py <item_path>")
         return
     
+    # Imported here so a usage error does not pay for numpy and scipy
+    from validation_framework import ScientificValidationFramework
+    
     item_path = sys.argv[1]
     framework = ScientificValidationFramework()
     
@@ -9,16 +9,270 @@ applying 100+ scientific reasoning methods with computational verification.
 import os
 import sys
 import json
+import math
 import time
 import shutil
 import logging
+import tempfile
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
 import re
+from functools import lru_cache
 import numpy as np
-from scipy import integrate, optimize
-import matplotlib.pyplot as plt
+
+from text_scanning import content_fingerprint, read_text_file
+
+# Indicator keywords for the reasoning methods, matched as lowercase substrings
+SKEPTICAL_INDICATORS = (
+    "assume", "question", "doubt", "verify", "test", "validate",
+    "evidence", "proof", "demonstrate", "confirm", "check",
+    "analysis", "examination", "investigation", "scrutiny",
+    "critical", "rigorous", "systematic", "methodical",
+    "falsification", "prediction", "hypothesis", "theory",
+    "experiment", "measurement", "observation", "data",
+    "uncertainty", "error", "limitation", "assumption",
+    "reproducible", "consistent", "accurate", "precise"
+)
+
+SIMPLICITY_INDICATORS = (
+    "simple", "minimal", "basic", "fundamental", "essential"
+)
+
+QUALITY_INDICATORS = (
+    "method", "result", "conclusion", "evidence", "data",
+    "analysis", "validation", "test", "measurement"
+)
+
+TESTABLE_INDICATORS = ("predict", "test", "measure", "observe", "verify")
+CORRESPONDENCE_TERMS = ("classical", "limit")
+CONSERVATION_TERMS = ("conserved", "conservation", "constant")
+SYMMETRY_TERMS = ("symmetry", "invariant", "symmetric")
+CRITICAL_ELEMENTS = ("limitation", "uncertainty", "error", "assumption")
+IMPLEMENTATION_TERMS = ("implement", "algorithm", "method", "procedure")
+
+PHYSICS_TERMS = (
+    "energy", "force", "momentum", "velocity", "acceleration",
+    "wave", "particle", "quantum", "field", "oscillator"
+)
+
+HARMONIC_OSCILLATOR_TERMS = ("harmonic", "oscillator")
+
+ALL_KEYWORDS = frozenset(
+    SKEPTICAL_INDICATORS + SIMPLICITY_INDICATORS + QUALITY_INDICATORS
+    + TESTABLE_INDICATORS + CORRESPONDENCE_TERMS + CONSERVATION_TERMS
+    + SYMMETRY_TERMS + CRITICAL_ELEMENTS + IMPLEMENTATION_TERMS
+    + PHYSICS_TERMS + HARMONIC_OSCILLATOR_TERMS
+)
+
+# Any-of pattern lists, compiled once and searched in turn until one matches
+UNIT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"\b(m|kg|s|A|K|mol|cd)\b",  # SI base units
+    r"\b(N|J|W|Pa|Hz)\b",        # Derived units
+    r"\b(meter|kilogram|second)\b" # Written units
+))
+
+def presence_pattern(pattern: str) -> str:
+    """
+    Rewrite an "a.*b.*c" chain used only to test for a match so it cannot
+    backtrack. Each gap commits to the first following part inside an atomic
+    group; any later part would also follow it, so whether the pattern
+    matches anywhere is unchanged. Atomic groups need Python 3.11, so older
+    interpreters keep the greedy chain.
+    """
+    if sys.version_info < (3, 11):
+        return pattern
+    head, *tail = pattern.split(".*")
+    return head + "".join(f"(?>.*?{part})" for part in tail)
+
+VIOLATION_PATTERNS = tuple(re.compile(presence_pattern(pattern), re.IGNORECASE) for pattern in (
+    r"energy.*created.*destroyed",
+    r"perpetual.*motion",
+    r"faster.*than.*light.*information"
+))
+
+# Extraction and integrity patterns are compiled once at import, so each
+# call skips re's internal compile-cache lookup
+CLAIM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r"we claim that (.+?)[\.\n]",
+    r"hypothesis: (.+?)[\.\n]",
+    r"we propose (.+?)[\.\n]",
+    r"theory suggests (.+?)[\.\n]",
+    r"framework establishes (.+?)[\.\n]",
+    r"reveals (.+?)[\.\n]",
+    r"demonstrates (.+?)[\.\n]",
+    r"shows that (.+?)[\.\n]",
+    r"proves (.+?)[\.\n]",
+    r"indicates (.+?)[\.\n]",
+    r"suggests (.+?)[\.\n]",
+    r"implies (.+?)[\.\n]",
+    r"predicts (.+?)[\.\n]",
+    r"the framework (.+?)[\.\n]",
+    r"this document presents (.+?)[\.\n]",
+    r"the synthesis reveals (.+?)[\.\n]",
+    r"results show (.+?)[\.\n]",
+    r"analysis demonstrates (.+?)[\.\n]",
+    r"evidence indicates (.+?)[\.\n]",
+    r"findings suggest (.+?)[\.\n]",
+    r"discovery of (.+?)[\.\n]",
+    r"breakthrough in (.+?)[\.\n]",
+    r"unified (.+?) relationship",
+    r"scale-invariant (.+?)[\.\n]",
+    r"quantum-cosmic (.+?)[\.\n]"
+))
+
+EQUATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"([A-Za-z]+\s*=\s*[^=\n]+)",
+    r"(\$[^$]+\$)",
+    r"(\\[a-zA-Z]+\{[^}]*\})"
+))
+
+HYPOTHESIS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r"hypothesis: (.+?)[\.\n]",
+    r"we hypothesize (.+?)[\.\n]",
+    r"prediction: (.+?)[\.\n]"
+))
+
+# Prohibited patterns from instructions - CORRECTED to catch actual violations
+PROHIBITED_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), description) for pattern, description in (
+    (r"quantum-cosmic resonance", "Quantum-cosmic resonance framework claims"),
+    (r"unified.*field.*theory", "Unified field theory claims"),
+    (r"breakthrough", "Breakthrough claims without proof"),  # FIXED: Any breakthrough claim
+    (r"discovery", "Discovery claims without validation"),    # FIXED: Any discovery claim
+    (r"universal scaling relationship", "Universal scaling claims"),
+    (r"golden ratio physics", "Golden ratio physics claims"),
+    (r"scale-invariant.*across.*\d+.*orders.*magnitude", "Extreme scale-invariant claims"),
+    (r"fundamental mechanism.*quantum.*cosmic", "Quantum-cosmic mechanism claims"),
+    (r"unified mathematical relationship.*quantum.*cosmic", "Unified quantum-cosmic claims"),
+    (r"novel.*discovery", "Novel discovery claims"),
+    (r"major.*breakthrough", "Major breakthrough claims"),
+    (r"research.*breakthrough", "Research breakthrough claims"),
+    (r"conceptual.*breakthrough", "Conceptual breakthrough claims")
+))
+
+# Theoretical claims that come from file organization rather than evidence
+FILE_ORG_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), description) for pattern, description in (
+    (r"synthesis.*reveals", "Claims from synthesis/organization"),
+    (r"framework.*establishes.*from.*educational", "Claims from educational framework"),
+    (r"performance.*monitoring.*reveals", "Claims from performance monitoring")
+))
+
+# Integrity patterns that are plain lowercase text. On ASCII content a
+# case-insensitive match is exactly a match in the lowercased text, so these
+# are counted with str.count instead of collecting every match
+LITERAL_INTEGRITY_PATTERNS = frozenset(
+    pattern.pattern for pattern, _ in PROHIBITED_PATTERNS + FILE_ORG_PATTERNS
+    if pattern.pattern == pattern.pattern.lower()
+    and set(pattern.pattern).isdisjoint(".^$*+?{}[]\\|()")
+)
+
+def literal_matches(content: str, content_lower: str, literal: str, limit: int) -> tuple:
+    """
+    Count the non-overlapping occurrences of a lowercase literal in content
+    (given alongside its lowercased form) and slice out the first few.
+    Returns the examples and the total count.
+    """
+    count = content_lower.count(literal)
+    examples = []
+    start = 0
+    while len(examples) < min(count, limit):
+        index = content_lower.find(literal, start)
+        examples.append(content[index:index + len(literal)])
+        start = index + len(literal)
+    return examples, count
+
+# Names of the dispatched stages 3-7, as used in their folder names
+STAGE_NAMES = {
+    3: "MULTI_METHOD_VERIFICATION",
+    4: "PEER_SIMULATION_REVIEW",
+    5: "STRESS_TESTING",
+    6: "REPRODUCIBILITY_VALIDATION",
+    7: "FINAL_SCIENTIFIC_REVIEW"
+}
+
+# Stage verdicts are cached on disk as JSON by content fingerprint. The
+# fingerprint is salted with the interpreter and numpy versions and the
+# stages' source, so upgrading or editing any of them invalidates it
+VERDICT_CACHE_DIR = Path(".validation_cache")
+VERDICT_CACHE_SALT = content_fingerprint(b"\0".join((
+    sys.version.encode(),
+    np.__version__.encode(),
+    Path(__file__).read_bytes(),
+    Path(__file__).with_name("text_scanning.py").read_bytes()
+))).encode()
+
+# Key marking a numpy scalar json cannot write natively in a cached verdict,
+# e.g. a simulation's np.bool_ checks, so it is restored with its type
+NUMPY_SCALAR_TAG = "__numpy_dtype__"
+
+def encode_verdict_value(value: Any) -> Dict[str, Any]:
+    """Encode a value json cannot serialise natively into a cached verdict"""
+    if isinstance(value, np.generic):
+        return {NUMPY_SCALAR_TAG: value.dtype.str, "value": value.item()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+def decode_verdict_object(obj: Dict[str, Any]) -> Any:
+    """Restore the numpy scalars tagged by encode_verdict_value"""
+    if NUMPY_SCALAR_TAG in obj:
+        return np.dtype(obj[NUMPY_SCALAR_TAG]).type(obj["value"])
+    return obj
+
+@lru_cache(maxsize=16)
+def scan_equations(content: str) -> tuple:
+    """Extract equation-like spans once per distinct content"""
+    equations = []
+    for pattern in EQUATION_PATTERNS:
+        equations.extend(pattern.findall(content))
+    return tuple(equations)
+
+@lru_cache(maxsize=16)
+def scan_keywords(content: str) -> frozenset:
+    """Find every indicator keyword present in content, lowercasing it once"""
+    content_lower = content.lower()
+    return frozenset(k for k in ALL_KEYWORDS if k in content_lower)
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Stage folders created in the working directory, in pipeline order
+VALIDATION_STAGES = (
+    "00-INTAKE",
+    "01-INITIAL_SCREENING",
+    "02-COMPUTATIONAL_VALIDATION",
+    "03-MULTI_METHOD_VERIFICATION",
+    "04-PEER_SIMULATION_REVIEW",
+    "05-STRESS_TESTING",
+    "06-REPRODUCIBILITY_VALIDATION",
+    "07-FINAL_SCIENTIFIC_REVIEW",
+    "08-APPROVED_RESEARCH",
+    "09-REJECTED_ITEMS"
+)
+
+def configure_logging() -> None:
+    """Log validation progress to validation_log.txt and the console"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler('validation_log.txt'),
+            logging.StreamHandler()
+        ]
+    )
+
+def create_stage_directories() -> Dict[str, Path]:
+    """Ensure all validation stage directories exist, returning their paths"""
+    stage_paths = {stage: Path(stage) for stage in VALIDATION_STAGES}
+    for stage_path in stage_paths.values():
+        stage_path.mkdir(exist_ok=True)
+    return stage_paths
+
+def prepare_validation_environment() -> None:
+    """
+    Set up logging and the stage folders without building a framework,
+    for a process that only dispatches items to workers
+    """
+    configure_logging()
+    create_stage_directories()
 
 class ScientificValidationFramework:
     """
@@ -26,41 +280,60 @@ class ScientificValidationFramework:
     with computational rigor and 100+ reasoning methods.
     """
     
-    def __init__(self):
+    def __init__(self, use_verdict_cache: bool = True):
         self.setup_logging()
         self.setup_directories()
         self.validation_methods = self.load_scientific_methods()
+        self.setup_dispatch_tables()
+        
+        # Content of items currently being validated, keyed by item path,
+        # so the eight stages share a single read
+        self.content_cache = {}
+        
+        # Where stage verdicts are cached across runs; None disables reuse
+        self.verdict_cache_dir = VERDICT_CACHE_DIR if use_verdict_cache else None
         
     def setup_logging(self):
         """Setup comprehensive logging for validation process"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('validation_log.txt'),
-                logging.StreamHandler()
-            ]
-        )
+        configure_logging()
         self.logger = logging.getLogger(__name__)
         
     def setup_directories(self):
         """Ensure all validation stage directories exist"""
-        self.stages = [
-            "00-INTAKE",
-            "01-INITIAL_SCREENING", 
-            "02-COMPUTATIONAL_VALIDATION",
-            "03-MULTI_METHOD_VERIFICATION",
-            "04-PEER_SIMULATION_REVIEW",
-            "05-STRESS_TESTING",
-            "06-REPRODUCIBILITY_VALIDATION",
-            "07-FINAL_SCIENTIFIC_REVIEW",
-            "08-APPROVED_RESEARCH",
-            "09-REJECTED_ITEMS"
-        ]
+        self.stages = list(VALIDATION_STAGES)
         
-        for stage in self.stages:
-            Path(stage).mkdir(exist_ok=True)
+        # Stage folder paths are built once and reused when filing items
+        self.stage_paths = create_stage_directories()
             
+    def setup_dispatch_tables(self):
+        """Build the stage and method dispatch tables once per framework"""
+        self.stage_methods = {
+            3: self.stage_3_multi_method_verification,
+            4: self.stage_4_peer_simulation_review,
+            5: self.stage_5_stress_testing,
+            6: self.stage_6_reproducibility_validation,
+            7: self.stage_7_final_scientific_review
+        }
+        
+        # Method IDs with concrete implementations; others pass by default
+        self.method_map = {
+            1: self.apply_falsificationism,
+            4: self.apply_occams_razor,
+            6: self.apply_correspondence_principle,
+            8: self.apply_conservation_principles,
+            10: self.apply_methodical_skepticism,
+            54: self.apply_dimensional_analysis
+        }
+        
+        # Independent approaches cross-checked in stage 3
+        self.verification_methods = (
+            ("Falsificationism", self.apply_falsificationism),
+            ("Correspondence Principle", self.apply_correspondence_principle),
+            ("Conservation Principles", self.apply_conservation_principles),
+            ("Symmetry Analysis", self.apply_symmetry_analysis),
+            ("Bootstrap Reasoning", self.apply_bootstrap_reasoning)
+        )
+        
     def load_scientific_methods(self):
         """Load the 100 scientific reasoning methods"""
         return {
@@ -90,64 +363,95 @@ class ScientificValidationFramework:
         """
         Main validation entry point - processes item through all 8 stages
         """
-        self.logger.info(f"Starting validation of: {item_path}")
+        self.logger.info("Starting validation of: %s", item_path)
         
         result = {
             "item_path": item_path,
-            "start_time": datetime.utcnow().isoformat(),
+            "start_time": datetime.now(timezone.utc).isoformat(),
             "stages_completed": [],
             "validation_results": {},
             "final_status": "PROCESSING"
         }
         
+        # Always start from a fresh read of the item
+        self.content_cache.pop(item_path, None)
+        
         try:
-            # Stage 0: Intake Processing
-            stage_result = self.stage_0_intake_processing(item_path)
-            result["validation_results"]["00-INTAKE"] = stage_result
-            
-            if not stage_result["passed"]:
-                return self.reject_item(result, "00-INTAKE", stage_result["failure_reason"])
-                
-            result["stages_completed"].append("00-INTAKE")
-            
-            # Stage 1: Initial Screening
-            stage_result = self.stage_1_initial_screening(item_path)
-            result["validation_results"]["01-INITIAL_SCREENING"] = stage_result
-            
-            if not stage_result["passed"]:
-                return self.reject_item(result, "01-INITIAL_SCREENING", stage_result["failure_reason"])
-                
-            result["stages_completed"].append("01-INITIAL_SCREENING")
-            
-            # Stage 2: Computational Validation
-            stage_result = self.stage_2_computational_validation(item_path)
-            result["validation_results"]["02-COMPUTATIONAL_VALIDATION"] = stage_result
+            # Items whose content was validated before reuse the stage verdict
+            cache_key = self.verdict_cache_key(item_path)
+            verdict = self.load_cached_verdict(cache_key)
             
-            if not stage_result["passed"]:
-                return self.reject_item(result, "02-COMPUTATIONAL_VALIDATION", stage_result["failure_reason"])
+            if verdict is not None:
+                self.logger.info("Reusing cached stage results for: %s", item_path)
+                result["validation_results"], result["stages_completed"], rejection = verdict
+            else:
+                rejection = self.run_validation_stages(item_path, result)
+                self.store_cached_verdict(
+                    cache_key,
+                    (result["validation_results"], result["stages_completed"], rejection)
+                )
                 
-            result["stages_completed"].append("02-COMPUTATIONAL_VALIDATION")
-            
-            # Continue through all stages...
-            for stage_num in range(3, 8):
-                stage_name = f"0{stage_num}-{self.get_stage_name(stage_num)}"
-                stage_result = self.execute_stage(stage_num, item_path)
-                result["validation_results"][stage_name] = stage_result
+            if rejection is not None:
+                return self.reject_item(result, *rejection)
                 
-                if not stage_result["passed"]:
-                    return self.reject_item(result, stage_name, stage_result["failure_reason"])
-                    
-                result["stages_completed"].append(stage_name)
-            
             # All stages passed - approve item
             return self.approve_item(result, item_path)
             
         except Exception as e:
-            self.logger.error(f"Validation error: {str(e)}")
+            self.logger.error("Validation error: %s", e)
             result["final_status"] = "ERROR"
             result["error"] = str(e)
             return result
             
+        finally:
+            self.content_cache.pop(item_path, None)
+            
+    def run_validation_stages(self, item_path: str, result: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Run the 8 stages, recording each stage result into result.
+        Returns the rejecting stage and reason, or None if every stage passed.
+        """
+        # Stage 0: Intake Processing
+        stage_result = self.stage_0_intake_processing(item_path)
+        result["validation_results"]["00-INTAKE"] = stage_result
+        
+        if not stage_result["passed"]:
+            return "00-INTAKE", stage_result["failure_reason"]
+            
+        result["stages_completed"].append("00-INTAKE")
+        
+        # Stage 1: Initial Screening
+        stage_result = self.stage_1_initial_screening(item_path)
+        result["validation_results"]["01-INITIAL_SCREENING"] = stage_result
+        
+        if not stage_result["passed"]:
+            return "01-INITIAL_SCREENING", stage_result["failure_reason"]
+            
+        result["stages_completed"].append("01-INITIAL_SCREENING")
+        
+        # Stage 2: Computational Validation
+        stage_result = self.stage_2_computational_validation(item_path)
+        result["validation_results"]["02-COMPUTATIONAL_VALIDATION"] = stage_result
+        
+        if not stage_result["passed"]:
+            return "02-COMPUTATIONAL_VALIDATION", stage_result["failure_reason"]
+            
+        result["stages_completed"].append("02-COMPUTATIONAL_VALIDATION")
+        
+        # Continue through all stages...
+        for stage_num in range(3, 8):
+            stage_name = f"0{stage_num}-{self.get_stage_name(stage_num)}"
+            stage_result = self.execute_stage(stage_num, item_path)
+            result["validation_results"][stage_name] = stage_result
+            
+            if not stage_result["passed"]:
+                return stage_name, stage_result["failure_reason"]
+                
+            result["stages_completed"].append(stage_name)
+        
+        # All stages passed
+        return None
+            
     def stage_0_intake_processing(self, item_path: str) -> Dict[str, Any]:
         """Stage 0: Basic intake validation and claim extraction"""
         self.logger.info("Stage 0: Intake Processing")
@@ -306,16 +610,10 @@ class ScientificValidationFramework:
             
     def execute_stage(self, stage_num: int, item_path: str) -> Dict[str, Any]:
         """Execute validation stages 3-7"""
-        stage_methods = {
-            3: self.stage_3_multi_method_verification,
-            4: self.stage_4_peer_simulation_review,
-            5: self.stage_5_stress_testing,
-            6: self.stage_6_reproducibility_validation,
-            7: self.stage_7_final_scientific_review
-        }
+        stage_method = self.stage_methods.get(stage_num)
         
-        if stage_num in stage_methods:
-            return stage_methods[stage_num](item_path)
+        if stage_method is not None:
+            return stage_method(item_path)
         else:
             return {"passed": False, "failure_reason": f"Unknown stage: {stage_num}"}
             
@@ -333,16 +631,8 @@ class ScientificValidationFramework:
             content = self.read_item_content(item_path)
             
             # Apply multiple verification methods
-            methods = [
-                ("Falsificationism", self.apply_falsificationism),
-                ("Correspondence Principle", self.apply_correspondence_principle),
-                ("Conservation Principles", self.apply_conservation_principles),
-                ("Symmetry Analysis", self.apply_symmetry_analysis),
-                ("Bootstrap Reasoning", self.apply_bootstrap_reasoning)
-            ]
-            
             passed_methods = 0
-            for method_name, method_func in methods:
+            for method_name, method_func in self.verification_methods:
                 try:
                     method_result = method_func(content)
                     result["methods_applied"].append((method_name, method_result))
@@ -350,7 +640,7 @@ class ScientificValidationFramework:
                         passed_methods += 1
                 except Exception as e:
                     result["methods_applied"].append((method_name, False))
-                    self.logger.warning(f"Method {method_name} failed: {str(e)}")
+                    self.logger.warning("Method %s failed: %s", method_name, e)
             
             # Independent verification
             independent_result = self.perform_independent_verification(content)
@@ -539,85 +829,46 @@ class ScientificValidationFramework:
     # Helper methods for content analysis and validation
     
     def read_item_content(self, item_path: str) -> str:
-        """Read content from file or directory"""
+        """Read content from file or directory, once per validation run"""
+        content = self.content_cache.get(item_path)
+        if content is None:
+            content = self.load_item_content(item_path)
+            self.content_cache[item_path] = content
+        return content
+        
+    def load_item_content(self, item_path: str) -> str:
+        """Load content from file or directory"""
         path = Path(item_path)
         if path.is_file():
-            return path.read_text(encoding='utf-8', errors='ignore')
+            return read_text_file(path)
         elif path.is_dir():
-            # Concatenate all text files in directory
-            content = ""
-            for file_path in path.rglob("*.txt"):
-                content += file_path.read_text(encoding='utf-8', errors='ignore') + "\n"
-            return content
+            # Concatenate all text files in directory, reading them concurrently
+            text_files = list(path.rglob("*.txt"))
+            with ThreadPoolExecutor(max_workers=min(8, len(text_files) or 1)) as executor:
+                texts = executor.map(read_text_file, text_files)
+                return "".join(text + "\n" for text in texts)
         else:
             return ""
             
     def extract_scientific_claims(self, content: str) -> List[str]:
         """Extract scientific claims from content"""
         # Look for claim indicators - expanded patterns
-        claim_patterns = [
-            r"we claim that (.+?)[\.\n]",
-            r"hypothesis: (.+?)[\.\n]", 
-            r"we propose (.+?)[\.\n]",
-            r"theory suggests (.+?)[\.\n]",
-            r"framework establishes (.+?)[\.\n]",
-            r"reveals (.+?)[\.\n]",
-            r"demonstrates (.+?)[\.\n]",
-            r"shows that (.+?)[\.\n]",
-            r"proves (.+?)[\.\n]",
-            r"indicates (.+?)[\.\n]",
-            r"suggests (.+?)[\.\n]",
-            r"implies (.+?)[\.\n]",
-            r"predicts (.+?)[\.\n]",
-            r"the framework (.+?)[\.\n]",
-            r"this document presents (.+?)[\.\n]",
-            r"the synthesis reveals (.+?)[\.\n]",
-            r"results show (.+?)[\.\n]",
-            r"analysis demonstrates (.+?)[\.\n]",
-            r"evidence indicates (.+?)[\.\n]",
-            r"findings suggest (.+?)[\.\n]",
-            r"discovery of (.+?)[\.\n]",
-            r"breakthrough in (.+?)[\.\n]",
-            r"unified (.+?) relationship",
-            r"scale-invariant (.+?)[\.\n]",
-            r"quantum-cosmic (.+?)[\.\n]"
-        ]
-        
         claims = []
-        for pattern in claim_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-            claims.extend(matches)
+        for pattern in CLAIM_PATTERNS:
+            claims.extend(pattern.findall(content))
             
         return claims
         
     def extract_equations(self, content: str) -> List[str]:
         """Extract mathematical equations from content"""
-        # Look for equation patterns
-        equation_patterns = [
-            r"([A-Za-z]+\s*=\s*[^=\n]+)",
-            r"(\$[^$]+\$)",
-            r"(\\[a-zA-Z]+\{[^}]*\})"
-        ]
-        
-        equations = []
-        for pattern in equation_patterns:
-            matches = re.findall(pattern, content)
-            equations.extend(matches)
-            
-        return equations
+        # Several stages extract from the same content, so the scan is memoized
+        return list(scan_equations(content))
         
     def extract_hypotheses(self, content: str) -> List[str]:
         """Extract testable hypotheses from content"""
-        hypothesis_patterns = [
-            r"hypothesis: (.+?)[\.\n]",
-            r"we hypothesize (.+?)[\.\n]",
-            r"prediction: (.+?)[\.\n]"
-        ]
-        
         hypotheses = []
-        for pattern in hypothesis_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-            hypotheses.extend(matches)
+        for pattern in HYPOTHESIS_PATTERNS:
+            hypotheses.extend(pattern.findall(content))
             
         return hypotheses
         
@@ -627,22 +878,16 @@ class ScientificValidationFramework:
         
     # Scientific reasoning method implementations
     
+    def find_keywords(self, content: str) -> frozenset:
+        """Return the indicator keywords that occur (case-insensitively) in content"""
+        return scan_keywords(content)
+        
     def apply_methodical_skepticism(self, content: str) -> bool:
         """Apply Method #10: Methodical Skepticism"""
         # Check for assumption questioning and foundation rebuilding - expanded indicators
-        skeptical_indicators = [
-            "assume", "question", "doubt", "verify", "test", "validate",
-            "evidence", "proof", "demonstrate", "confirm", "check",
-            "analysis", "examination", "investigation", "scrutiny",
-            "critical", "rigorous", "systematic", "methodical",
-            "falsification", "prediction", "hypothesis", "theory",
-            "experiment", "measurement", "observation", "data",
-            "uncertainty", "error", "limitation", "assumption",
-            "reproducible", "consistent", "accurate", "precise"
-        ]
-        
-        skeptical_count = sum(1 for indicator in skeptical_indicators 
-                            if indicator.lower() in content.lower())
+        keywords = self.find_keywords(content)
+        skeptical_count = sum(1 for indicator in SKEPTICAL_INDICATORS 
+                            if indicator in keywords)
         
         # More lenient threshold for comprehensive scientific documents
         return skeptical_count >= 8
@@ -650,12 +895,9 @@ class ScientificValidationFramework:
     def apply_occams_razor(self, content: str) -> bool:
         """Apply Method #4: Occam's Razor"""
         # Check for simplicity preference
-        complexity_indicators = [
-            "simple", "minimal", "basic", "fundamental", "essential"
-        ]
-        
-        simplicity_count = sum(1 for indicator in complexity_indicators
-                             if indicator.lower() in content.lower())
+        keywords = self.find_keywords(content)
+        simplicity_count = sum(1 for indicator in SIMPLICITY_INDICATORS
+                             if indicator in keywords)
         
         return simplicity_count >= 2
         
@@ -665,28 +907,14 @@ class ScientificValidationFramework:
         equations = self.extract_equations(content)
         
         # Basic dimensional analysis - check for units
-        unit_patterns = [
-            r"\b(m|kg|s|A|K|mol|cd)\b",  # SI base units
-            r"\b(N|J|W|Pa|Hz)\b",        # Derived units
-            r"\b(meter|kilogram|second)\b" # Written units
-        ]
-        
-        has_units = any(re.search(pattern, content, re.IGNORECASE) 
-                       for pattern in unit_patterns)
+        has_units = any(pattern.search(content) for pattern in UNIT_PATTERNS)
         
         return has_units and len(equations) > 0
         
     def check_physics_consistency(self, content: str) -> bool:
         """Check for basic physics consistency"""
         # Look for conservation law violations or impossible claims
-        violation_patterns = [
-            r"energy.*created.*destroyed",
-            r"perpetual.*motion",
-            r"faster.*than.*light.*information"
-        ]
-        
-        has_violations = any(re.search(pattern, content, re.IGNORECASE)
-                           for pattern in violation_patterns)
+        has_violations = any(pattern.search(content) for pattern in VIOLATION_PATTERNS)
         
         return not has_violations
         
@@ -705,13 +933,9 @@ class ScientificValidationFramework:
         
     def contains_physics(self, content: str) -> bool:
         """Check if content contains physics concepts"""
-        physics_terms = [
-            "energy", "force", "momentum", "velocity", "acceleration",
-            "wave", "particle", "quantum", "field", "oscillator"
-        ]
-        
-        physics_count = sum(1 for term in physics_terms
-                          if term.lower() in content.lower())
+        keywords = self.find_keywords(content)
+        physics_count = sum(1 for term in PHYSICS_TERMS
+                          if term in keywords)
         
         return physics_count >= 3
         
@@ -721,7 +945,8 @@ class ScientificValidationFramework:
         
         try:
             # Simple harmonic oscillator simulation
-            if "harmonic" in content.lower() and "oscillator" in content.lower():
+            keywords = self.find_keywords(content)
+            if all(term in keywords for term in HARMONIC_OSCILLATOR_TERMS):
                 sim_result = self.simulate_harmonic_oscillator()
                 results["harmonic_oscillator"] = sim_result
                 results["simulations_run"] += 1
@@ -729,7 +954,7 @@ class ScientificValidationFramework:
                     results["simulations_passed"] += 1
                     
         except Exception as e:
-            self.logger.warning(f"Simulation error: {str(e)}")
+            self.logger.warning("Simulation error: %s", e)
             
         return results
         
@@ -737,7 +962,7 @@ class ScientificValidationFramework:
         """Simulate simple harmonic oscillator with proper force equation F = -kx"""
         # Parameters
         m, k = 1.0, 1.0  # mass, spring constant
-        omega = np.sqrt(k/m)
+        omega = math.sqrt(k/m)
         
         # Initial conditions
         x0, v0 = 1.0, 0.0
@@ -804,22 +1029,19 @@ class ScientificValidationFramework:
     
     def apply_falsificationism(self, content: str) -> bool:
         """Apply falsificationism - look for testable predictions"""
-        testable_indicators = ["predict", "test", "measure", "observe", "verify"]
-        return any(indicator in content.lower() for indicator in testable_indicators)
+        return not self.find_keywords(content).isdisjoint(TESTABLE_INDICATORS)
         
     def apply_correspondence_principle(self, content: str) -> bool:
         """Check correspondence to known physics"""
-        return "classical" in content.lower() or "limit" in content.lower()
+        return not self.find_keywords(content).isdisjoint(CORRESPONDENCE_TERMS)
         
     def apply_conservation_principles(self, content: str) -> bool:
         """Check for conservation law compliance"""
-        conservation_terms = ["conserved", "conservation", "constant"]
-        return any(term in content.lower() for term in conservation_terms)
+        return not self.find_keywords(content).isdisjoint(CONSERVATION_TERMS)
         
     def apply_symmetry_analysis(self, content: str) -> bool:
         """Apply symmetry analysis"""
-        symmetry_terms = ["symmetry", "invariant", "symmetric"]
-        return any(term in content.lower() for term in symmetry_terms)
+        return not self.find_keywords(content).isdisjoint(SYMMETRY_TERMS)
         
     def apply_bootstrap_reasoning(self, content: str) -> bool:
         """Apply bootstrap reasoning"""
@@ -832,27 +1054,21 @@ class ScientificValidationFramework:
     def simulate_peer_review(self, content: str) -> float:
         """Simulate peer review process"""
         # Score based on content quality indicators
-        quality_indicators = [
-            "method", "result", "conclusion", "evidence", "data",
-            "analysis", "validation", "test", "measurement"
-        ]
-        
+        keywords = self.find_keywords(content)
         score = 0.0
-        for indicator in quality_indicators:
-            if indicator in content.lower():
+        for indicator in QUALITY_INDICATORS:
+            if indicator in keywords:
                 score += 0.1
                 
         return min(score, 1.0)
         
     def apply_critical_assessment(self, content: str) -> bool:
         """Apply critical scientific assessment"""
-        critical_elements = ["limitation", "uncertainty", "error", "assumption"]
-        return any(element in content.lower() for element in critical_elements)
+        return not self.find_keywords(content).isdisjoint(CRITICAL_ELEMENTS)
         
     def verify_implementation(self, content: str) -> bool:
         """Verify implementation details"""
-        implementation_terms = ["implement", "algorithm", "method", "procedure"]
-        return any(term in content.lower() for term in implementation_terms)
+        return not self.find_keywords(content).isdisjoint(IMPLEMENTATION_TERMS)
         
     def generate_edge_cases(self, content: str) -> List[Dict[str, Any]]:
         """Generate edge cases for testing"""
@@ -877,76 +1093,103 @@ class ScientificValidationFramework:
         
     def apply_validation_method(self, method_id: int, content: str) -> bool:
         """Apply specific validation method by ID"""
-        # Map method IDs to implementations
-        method_map = {
-            1: self.apply_falsificationism,
-            4: self.apply_occams_razor,
-            6: self.apply_correspondence_principle,
-            8: self.apply_conservation_principles,
-            10: self.apply_methodical_skepticism,
-            54: self.apply_dimensional_analysis
-        }
+        method = self.method_map.get(method_id)
         
-        if method_id in method_map:
-            return method_map[method_id](content)
+        if method is not None:
+            return method(content)
         else:
             return True  # Default pass for unimplemented methods
             
     def get_stage_name(self, stage_num: int) -> str:
         """Get stage name by number"""
-        stage_names = {
-            3: "MULTI_METHOD_VERIFICATION",
-            4: "PEER_SIMULATION_REVIEW", 
-            5: "STRESS_TESTING",
-            6: "REPRODUCIBILITY_VALIDATION",
-            7: "FINAL_SCIENTIFIC_REVIEW"
-        }
-        return stage_names.get(stage_num, "UNKNOWN")
+        return STAGE_NAMES.get(stage_num, "UNKNOWN")
+        
+    def verdict_cache_key(self, item_path: str) -> Optional[str]:
+        """Fingerprint the item content for the verdict cache, or None if not cached"""
+        if self.verdict_cache_dir is None:
+            return None
+            
+        try:
+            content = self.read_item_content(item_path)
+        except Exception:
+            return None  # Stage 0 reports unreadable items
+            
+        return content_fingerprint(VERDICT_CACHE_SALT + content.encode('utf-8'))
+        
+    def load_cached_verdict(self, cache_key: Optional[str]) -> Optional[Tuple[Dict[str, Any], List[str], Optional[Tuple[str, str]]]]:
+        """Load the stage results, completed stages and rejection cached under a key"""
+        if cache_key is None:
+            return None
+            
+        try:
+            return json.loads(
+                (self.verdict_cache_dir / f"{cache_key}.json").read_bytes(),
+                object_hook=decode_verdict_object
+            )
+        except Exception:
+            return None  # Missing or unreadable entries are recomputed
+            
+    def store_cached_verdict(self, cache_key: Optional[str], verdict: Tuple[Dict[str, Any], List[str], Optional[Tuple[str, str]]]):
+        """Cache a stage verdict under a key, replacing any previous entry atomically"""
+        if cache_key is None:
+            return
+            
+        try:
+            # The standard json module keeps the infinite edge case values
+            data = json.dumps(verdict, default=encode_verdict_value)
+            self.verdict_cache_dir.mkdir(exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.verdict_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(temp_path, self.verdict_cache_dir / f"{cache_key}.json")
+        except Exception as e:
+            self.logger.warning("Failed to cache stage results: %s", e)
+            
+    def file_item(self, item_path: str, stage: str) -> Path:
+        """Copy an item into a disposition folder, leaving the original in place"""
+        source = Path(item_path)
+        destination = self.stage_paths[stage] / source.name
+        
+        # Single stat to pick the copy strategy
+        if source.is_dir():
+            shutil.copytree(source, destination, dirs_exist_ok=True)
+        else:
+            shutil.copy2(source, destination)
+            
+        return destination
         
     def approve_item(self, result: Dict[str, Any], item_path: str) -> Dict[str, Any]:
         """Approve item and move to approved folder"""
-        self.logger.info(f"APPROVED: {item_path}")
+        self.logger.info("APPROVED: %s", item_path)
         
         # Move item to approved folder
-        item_name = Path(item_path).name
-        approved_path = Path("08-APPROVED_RESEARCH") / item_name
-        
         try:
-            if Path(item_path).is_file():
-                shutil.copy2(item_path, approved_path)
-            else:
-                shutil.copytree(item_path, approved_path, dirs_exist_ok=True)
+            self.file_item(item_path, "08-APPROVED_RESEARCH")
         except Exception as e:
-            self.logger.warning(f"Failed to move approved item: {str(e)}")
+            self.logger.warning("Failed to move approved item: %s", e)
             
         result["final_status"] = "APPROVED"
         result["quality_score"] = 87.5  # Example score
         result["confidence_level"] = 0.92
-        result["end_time"] = datetime.utcnow().isoformat()
+        result["end_time"] = datetime.now(timezone.utc).isoformat()
         
         return result
         
     def reject_item(self, result: Dict[str, Any], stage: str, reason: str) -> Dict[str, Any]:
         """Reject item and move to rejected folder"""
         item_path = result["item_path"]
-        self.logger.info(f"REJECTED at {stage}: {item_path} - {reason}")
+        self.logger.info("REJECTED at %s: %s - %s", stage, item_path, reason)
         
         # Move item to rejected folder
-        item_name = Path(item_path).name
-        rejected_path = Path("09-REJECTED_ITEMS") / item_name
-        
         try:
-            if Path(item_path).is_file():
-                shutil.copy2(item_path, rejected_path)
-            else:
-                shutil.copytree(item_path, rejected_path, dirs_exist_ok=True)
+            self.file_item(item_path, "09-REJECTED_ITEMS")
         except Exception as e:
-            self.logger.warning(f"Failed to move rejected item: {str(e)}")
+            self.logger.warning("Failed to move rejected item: %s", e)
             
         result["final_status"] = "REJECTED"
         result["rejection_stage"] = stage
         result["rejection_reason"] = reason
-        result["end_time"] = datetime.utcnow().isoformat()
+        result["end_time"] = datetime.now(timezone.utc).isoformat()
         
         return result
         
@@ -961,51 +1204,25 @@ class ScientificValidationFramework:
             "is_pseudoscientific": False
         }
         
-        # Prohibited patterns from instructions - CORRECTED to catch actual violations
-        prohibited_patterns = [
-            (r"quantum-cosmic resonance", "Quantum-cosmic resonance framework claims"),
-            (r"unified.*field.*theory", "Unified field theory claims"),
-            (r"breakthrough", "Breakthrough claims without proof"),  # FIXED: Any breakthrough claim
-            (r"discovery", "Discovery claims without validation"),    # FIXED: Any discovery claim
-            (r"universal scaling relationship", "Universal scaling claims"),
-            (r"golden ratio physics", "Golden ratio physics claims"),
-            (r"scale-invariant.*across.*\d+.*orders.*magnitude", "Extreme scale-invariant claims"),
-            (r"fundamental mechanism.*quantum.*cosmic", "Quantum-cosmic mechanism claims"),
-            (r"unified mathematical relationship.*quantum.*cosmic", "Unified quantum-cosmic claims"),
-            (r"novel.*discovery", "Novel discovery claims"),
-            (r"major.*breakthrough", "Major breakthrough claims"),
-            (r"research.*breakthrough", "Research breakthrough claims"),
-            (r"conceptual.*breakthrough", "Conceptual breakthrough claims")
-        ]
+        # Literal patterns are counted directly when lowercasing is exact
+        content_lower = content.lower() if content.isascii() else None
         
-        for pattern, description in prohibited_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                result["violations_found"].append({
-                    "pattern": pattern,
-                    "description": description,
-                    "matches": matches[:3],  # First 3 examples
-                    "count": len(matches)
-                })
-                result["violation_count"] += len(matches)
-        
-        # Check for theoretical claims from file organization
-        file_org_patterns = [
-            (r"synthesis.*reveals", "Claims from synthesis/organization"),
-            (r"framework.*establishes.*from.*educational", "Claims from educational framework"),
-            (r"performance.*monitoring.*reveals", "Claims from performance monitoring")
-        ]
-        
-        for pattern, description in file_org_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                result["violations_found"].append({
-                    "pattern": pattern,
-                    "description": description,
-                    "matches": matches[:2],
-                    "count": len(matches)
-                })
-                result["violation_count"] += len(matches)
+        for patterns, limit in ((PROHIBITED_PATTERNS, 3), (FILE_ORG_PATTERNS, 2)):
+            for pattern, description in patterns:
+                if content_lower is not None and pattern.pattern in LITERAL_INTEGRITY_PATTERNS:
+                    examples, count = literal_matches(content, content_lower, pattern.pattern, limit)
+                else:
+                    matches = pattern.findall(content)
+                    examples, count = matches[:limit], len(matches)
+                    
+                if count:
+                    result["violations_found"].append({
+                        "pattern": pattern.pattern,
+                        "description": description,
+                        "matches": examples,  # First few examples
+                        "count": count
+                    })
+                    result["violation_count"] += count
         
         # Mark as pseudoscientific if violations found
         result["is_pseudoscientific"] = result["violation_count"] > 0